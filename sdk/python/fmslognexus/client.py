@@ -1,17 +1,34 @@
 """FMS Log Nexus Python SDK Client."""
 
+import atexit
+import functools
+import gzip
+import json
 import os
+import queue
 import socket
 import threading
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional, Union
 from collections import deque
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 from .models import (
     LogLevel,
     ServerStatus,
@@ -40,6 +57,199 @@ from .exceptions import (
 )
 
 
+def _dumps(data: Any) -> bytes:
+    """Serialize a request body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode("utf-8")
+
+
+def _loads(content: bytes) -> Any:
+    """Deserialize a response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _enum_value(enum_class: type, value: Union[Enum, str]) -> str:
+    """Return the wire value of an enum member or its string value.
+
+    Members pass straight through; strings are validated against the enum.
+    Passing the enum member avoids the lookup.
+    """
+    if type(value) is enum_class:
+        return value.value
+    return enum_class(value).value
+
+
+_LEVEL_TRACE = LogLevel.TRACE.value
+_LEVEL_DEBUG = LogLevel.DEBUG.value
+_LEVEL_INFORMATION = LogLevel.INFORMATION.value
+_LEVEL_WARNING = LogLevel.WARNING.value
+_LEVEL_ERROR = LogLevel.ERROR.value
+_LEVEL_CRITICAL = LogLevel.CRITICAL.value
+
+
+@functools.lru_cache(maxsize=512)
+def _build_url(base_url: str, endpoint: str) -> str:
+    """Join the base URL and an endpoint, caching the most recent results."""
+    return f"{base_url}/api/{endpoint}"
+
+
+_iso_prefix_cache = (-1, "")
+
+
+def _iso_utc(ts_ns: int) -> str:
+    """Format a nanosecond epoch timestamp as an ISO-8601 UTC string.
+
+    The date/time prefix is cached per second, so entries written within the
+    same second only pay for formatting the microseconds.
+    """
+    global _iso_prefix_cache
+    sec, ns = divmod(ts_ns, 1_000_000_000)
+    cached_sec, prefix = _iso_prefix_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S.", time.gmtime(sec))
+        _iso_prefix_cache = (sec, prefix)
+    return f"{prefix}{ns // 1000:06d}Z"
+
+
+def _token_expiry(response: Dict[str, Any]) -> Optional[datetime]:
+    """Access token expiry from a login or refresh response.
+
+    The API sends ``expiresIn`` seconds; an absolute ``expiresAt`` is used
+    when present.
+    """
+    expires_at = response.get("expiresAt")
+    if expires_at:
+        return datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
+    expires_in = response.get("expiresIn")
+    if expires_in is None:
+        return None
+    return datetime.now(tz=timezone.utc) + timedelta(seconds=expires_in)
+
+
+class _Retry(Retry):
+    """Retry policy that only resends a POST the server turned away.
+
+    429 and 503 mean the request was refused without being processed; any
+    other 5xx may come after a POST took effect, and resending it would
+    duplicate executions or log batches. Idempotent methods retry on every
+    status in ``status_forcelist``.
+    """
+
+    POST_RETRY_STATUSES = frozenset([429, 503])
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method == "POST" and status_code not in self.POST_RETRY_STATUSES:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class _BackgroundSender:
+    """Shared worker thread for fire-and-forget requests.
+
+    Queued requests and the log buffer are both drained by the same daemon
+    thread, so telemetry writes never block the caller on a round-trip.
+    """
+
+    def __init__(self, client: "FMSClient", max_queue: int, overflow: str):
+        if overflow not in ("block", "drop"):
+            raise ValueError("overflow must be 'block' or 'drop'")
+        self._client = client
+        self.overflow = overflow
+        self.dropped = 0
+        self.failed = 0
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped
+
+    def start(self) -> None:
+        """Start the worker thread on first use."""
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None and not self._stopped:
+                    self._thread = threading.Thread(
+                        target=self._run,
+                        name="fmslognexus-sender",
+                        daemon=True,
+                    )
+                    self._thread.start()
+                    # The thread is a daemon, so send whatever is still
+                    # buffered when the interpreter exits without close()
+                    atexit.register(self.stop)
+
+    def wake(self) -> None:
+        """Ask the worker to drain immediately."""
+        self._wake.set()
+
+    def submit(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> bool:
+        """Queue a request. Returns False if it was dropped.
+
+        Once the sender is stopped the request is sent synchronously, since
+        no worker is left to drain the queue.
+        """
+        if self._stopped:
+            self._send(method, endpoint, data)
+            return True
+        self.start()
+        item = (method, endpoint, data)
+        if self.overflow == "block":
+            self._queue.put(item)
+        else:
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self.dropped += 1
+                return False
+        if self._stopped:
+            # Stopped while queueing; the final drain may already have run
+            self._drain()
+        else:
+            self._wake.set()
+        return True
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self._wake.wait(self._client.logs.flush_interval)
+            self._wake.clear()
+            self._drain()
+
+    def _send(self, method: str, endpoint: str, data: Optional[Dict[str, Any]]) -> None:
+        try:
+            self._client._request(method, endpoint, data=data)
+        except Exception:
+            # Count every failure; an exception escaping here would end
+            # the worker thread and strand everything queued after it
+            self.failed += 1
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                method, endpoint, data = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self._send(method, endpoint, data)
+        self._client.logs._drain()
+
+    def stop(self) -> None:
+        """Stop the worker and send everything still queued."""
+        atexit.unregister(self.stop)
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._drain()
+
+
 class FMSClient:
     """Main client for FMS Log Nexus API."""
 
@@ -53,6 +263,12 @@ class FMSClient:
         timeout: int = 30,
         retry_attempts: int = 3,
         retry_delay: float = 1.0,
+        pool_connections: int = 10,
+        pool_maxsize: int = 32,
+        max_queue: int = 10000,
+        overflow: str = "block",
+        compress_min_size: Optional[int] = 1024,
+        transport: str = "requests",
     ):
         """
         Initialize the FMS Log Nexus client.
@@ -66,117 +282,298 @@ class FMSClient:
             timeout: Request timeout in seconds.
             retry_attempts: Number of retry attempts.
             retry_delay: Delay between retries in seconds.
+            pool_connections: Number of connection pools to cache.
+            pool_maxsize: Maximum connections kept alive per host. With the
+                requests transport every thread has its own session, so this
+                bounds each thread's pool; with httpx it bounds the single
+                shared pool and should be raised to the expected concurrency.
+            max_queue: Maximum pending background requests and buffered logs.
+            overflow: What to do when the background queue is full: "block"
+                waits for space, "drop" discards the item and counts it in
+                ``dropped_count``.
+            compress_min_size: Request bodies of at least this many bytes are
+                sent gzip-compressed. The server must accept
+                ``Content-Encoding: gzip``; pass None to disable.
+            transport: "requests" (default) or "httpx". The httpx transport
+                multiplexes all calls over HTTP/2 when ``httpx[http2]`` is
+                installed; it retries connection failures only. Falls back
+                to requests when httpx is not installed.
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.server_name = server_name or socket.gethostname()
+        self._default_user = os.getenv("USER") or os.getenv("USERNAME") or "unknown"
         self.timeout = timeout
         self.retry_attempts = retry_attempts
         self.retry_delay = retry_delay
+        self.compress_min_size = compress_min_size
 
         self._access_token: Optional[str] = None
         self._refresh_token: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
-
-        # Configure session with retry
-        self._session = requests.Session()
-        retry_strategy = Retry(
-            total=retry_attempts,
-            backoff_factor=retry_delay,
-            status_forcelist=[500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self._session.mount("http://", adapter)
-        self._session.mount("https://", adapter)
+        self._headers_cache: Optional[Dict[str, str]] = None
+        self._refresh_skew = timedelta(seconds=30)
+        # After a failed early refresh, wait this long before trying again
+        self._refresh_retry_interval = 5.0
+        self._refresh_retry_at = 0.0
+        self._auth_lock = threading.Lock()
+
+        # Each thread gets its own session (and connection pool) so
+        # concurrent callers don't contend on a single urllib3 pool lock.
+        # _sessions tracks them by thread so they can be closed.
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._local = threading.local()
+        self._sessions: Dict[threading.Thread, requests.Session] = {}
+        self._sessions_lock = threading.Lock()
+
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+
+        self._hx = None
+        if transport == "httpx" and httpx is not None:
+            self._hx = self._create_httpx_client()
+        elif transport not in ("requests", "httpx"):
+            raise ValueError("transport must be 'requests' or 'httpx'")
 
         # Authenticate if credentials provided
         if username and password:
             self.login(username, password)
 
+        self._sender = _BackgroundSender(self, max_queue, overflow)
+
         # Initialize sub-clients
-        self.logs = LogClient(self)
+        self.logs = LogClient(self, max_queue=max_queue)
         self.servers = ServerClient(self)
         self.jobs = JobClient(self)
         self.executions = ExecutionClient(self)
         self.alerts = AlertClient(self)
 
+    def __enter__(self) -> "FMSClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def dropped_count(self) -> int:
+        """Number of background requests and log entries dropped on overflow."""
+        return self._sender.dropped + self.logs.dropped_count
+
+    def close(self) -> None:
+        """Send pending background requests and release the HTTP sessions."""
+        self.servers.stop_auto_heartbeat()
+        self._sender.stop()
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown()
+            self._prefetch_pool = None
+        with self._sessions_lock:
+            for session in self._sessions.values():
+                session.close()
+        if self._hx is not None:
+            self._hx.close()
+
+    def _prefetcher(self) -> ThreadPoolExecutor:
+        """Worker thread that fetches the next page for iter_search().
+
+        One worker is shared by every iterator, so page fetches reuse its
+        session and connection instead of opening new ones per call.
+        """
+        if self._prefetch_pool is None:
+            with self._sessions_lock:
+                if self._prefetch_pool is None:
+                    self._prefetch_pool = ThreadPoolExecutor(
+                        max_workers=1,
+                        thread_name_prefix="fmslognexus-prefetch",
+                    )
+        return self._prefetch_pool
+
+    def _create_httpx_client(self) -> "httpx.Client":
+        """Build a shared httpx client, using HTTP/2 when h2 is available."""
+        limits = httpx.Limits(
+            max_connections=self._pool_maxsize,
+            max_keepalive_connections=self._pool_maxsize,
+        )
+        try:
+            hx_transport = httpx.HTTPTransport(http2=True, limits=limits, retries=self.retry_attempts)
+        except ImportError:
+            hx_transport = httpx.HTTPTransport(limits=limits, retries=self.retry_attempts)
+        return httpx.Client(
+            transport=hx_transport,
+            timeout=self.timeout,
+            headers=self._get_headers(),
+        )
+
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests."""
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
+        if self._headers_cache is None:
+            headers = {
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+            }
+
+            if self.api_key:
+                headers["X-Api-Key"] = self.api_key
+            elif self._access_token:
+                headers["Authorization"] = f"Bearer {self._access_token}"
+
+            self._headers_cache = headers
+        return self._headers_cache
+
+    @property
+    def _session(self) -> requests.Session:
+        """HTTP session for the calling thread, created on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            retry_strategy = _Retry(
+                total=self.retry_attempts,
+                connect=self.retry_attempts,
+                read=0,
+                backoff_factor=self.retry_delay,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                max_retries=retry_strategy,
+                pool_connections=self._pool_connections,
+                pool_maxsize=self._pool_maxsize,
+                pool_block=False,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            with self._sessions_lock:
+                session.headers.update(self._get_headers())
+                # Close the sessions of threads that have finished since
+                for thread in [t for t in self._sessions if not t.is_alive()]:
+                    self._sessions.pop(thread).close()
+                self._sessions[threading.current_thread()] = session
+            self._local.session = session
+        return session
+
+    def _apply_headers(self) -> None:
+        """Rebuild the cached headers and install them as session defaults."""
+        with self._sessions_lock:
+            self._headers_cache = None
+            headers = self._get_headers()
+            targets = [session.headers for session in self._sessions.values()]
+            if self._hx is not None:
+                targets.append(self._hx.headers)
+            # Other threads may be building requests from these headers, so
+            # overwrite in place and only remove credentials no longer in use
+            for target in targets:
+                target.update(headers)
+                for name in ("X-Api-Key", "Authorization"):
+                    if name not in headers:
+                        target.pop(name, None)
+
+    def set_tokens(
+        self,
+        access_token: Optional[str],
+        refresh_token: Optional[str] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        """Use previously issued JWT tokens for subsequent requests.
 
-        if self.api_key:
-            headers["X-Api-Key"] = self.api_key
-        elif self._access_token:
-            headers["Authorization"] = f"Bearer {self._access_token}"
+        A naive ``expires_at`` (e.g. from ``datetime.utcnow()``) is taken to
+        be UTC.
+        """
+        if expires_at is not None and expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        self._access_token = access_token
+        self._refresh_token = refresh_token
+        self._token_expires_at = expires_at
+        self._apply_headers()
+
+    @property
+    def token_expires_at(self) -> Optional[datetime]:
+        """Expiry of the current access token, if known."""
+        return self._token_expires_at
+
+    def _token_expiring(self) -> bool:
+        """Return True when the access token is about to expire."""
+        return bool(
+            self._refresh_token
+            and self._token_expires_at
+            and datetime.now(tz=timezone.utc) + self._refresh_skew >= self._token_expires_at
+        )
+
+    def _token_expired(self) -> bool:
+        """Return True once the access token has actually expired."""
+        return datetime.now(tz=timezone.utc) >= self._token_expires_at
+
+    def _should_refresh(self) -> bool:
+        return self._token_expiring() and (
+            self._token_expired() or time.monotonic() >= self._refresh_retry_at
+        )
 
-        return headers
+    def _refresh_if_needed(self) -> None:
+        """Refresh the access token before it expires.
+
+        While the current token is still valid, a failed refresh (e.g. a
+        transient 5xx) is not raised: the request goes ahead with the current
+        token and the refresh is retried after ``_refresh_retry_interval``
+        seconds. Once the token has expired, refresh errors propagate.
+        """
+        if not self._should_refresh():
+            return
+        with self._auth_lock:
+            if not self._should_refresh():
+                return
+            try:
+                self.refresh()
+            except FMSError:
+                if self._token_expired():
+                    raise
+                self._refresh_retry_at = time.monotonic() + self._refresh_retry_interval
+
+    # Status code -> (exception class, default message)
+    _STATUS_ERRORS = {
+        400: (ValidationError, "Validation failed"),
+        401: (AuthenticationError, "Authentication failed"),
+        403: (AuthorizationError, "Access denied"),
+        404: (NotFoundError, "Resource not found"),
+        409: (ConflictError, "Resource conflict"),
+        429: (RateLimitError, "Rate limit exceeded"),
+    }
+
+    def _handle_response(self, response: Any, raw: bool = False) -> Any:
+        """Handle API response and raise appropriate exceptions.
+
+        With raw=True a successful response body is returned undecoded.
+        """
+        status_code = response.status_code
+        if raw and (status_code == 200 or status_code == 201):
+            return response.content
 
-    def _handle_response(self, response: requests.Response) -> Any:
-        """Handle API response and raise appropriate exceptions."""
         try:
-            data = response.json() if response.content else None
+            data = _loads(response.content) if response.content else None
         except ValueError:
             data = None
 
-        if response.status_code == 200 or response.status_code == 201:
+        if status_code == 200 or status_code == 201:
             return data
-        elif response.status_code == 204:
+        if status_code == 204:
             return None
-        elif response.status_code == 400:
-            errors = data.get("errors") if data else None
-            raise ValidationError(
-                data.get("detail", "Validation failed") if data else "Validation failed",
-                response.status_code,
-                data,
-                errors,
-            )
-        elif response.status_code == 401:
-            raise AuthenticationError(
-                data.get("detail", "Authentication failed") if data else "Authentication failed",
-                response.status_code,
-                data,
-            )
-        elif response.status_code == 403:
-            raise AuthorizationError(
-                data.get("detail", "Access denied") if data else "Access denied",
-                response.status_code,
-                data,
-            )
-        elif response.status_code == 404:
-            raise NotFoundError(
-                data.get("detail", "Resource not found") if data else "Resource not found",
-                response.status_code,
-                data,
-            )
-        elif response.status_code == 409:
-            raise ConflictError(
-                data.get("detail", "Resource conflict") if data else "Resource conflict",
-                response.status_code,
-                data,
-            )
-        elif response.status_code == 429:
+
+        entry = self._STATUS_ERRORS.get(status_code)
+        if entry is None:
+            if status_code >= 500:
+                entry = (ServerError, "Server error")
+            else:
+                entry = (FMSError, f"HTTP {status_code}")
+        exc_class, default_message = entry
+        is_dict = isinstance(data, dict)
+        message = (data.get("detail") if is_dict else None) or default_message
+
+        if status_code == 400:
+            errors = data.get("errors") if is_dict else None
+            raise ValidationError(message, status_code, data, errors)
+        if status_code == 429:
             retry_after = response.headers.get("Retry-After")
-            raise RateLimitError(
-                data.get("detail", "Rate limit exceeded") if data else "Rate limit exceeded",
-                response.status_code,
-                data,
-                int(retry_after) if retry_after else None,
-            )
-        elif response.status_code >= 500:
-            raise ServerError(
-                data.get("detail", "Server error") if data else "Server error",
-                response.status_code,
-                data,
-            )
-        else:
-            raise FMSError(
-                data.get("detail", f"HTTP {response.status_code}") if data else f"HTTP {response.status_code}",
-                response.status_code,
-                data,
-            )
+            raise RateLimitError(message, status_code, data, int(retry_after) if retry_after else None)
+        raise exc_class(message, status_code, data)
 
     def _request(
         self,
@@ -184,25 +581,56 @@ class FMSClient:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
+        raw: bool = False,
     ) -> Any:
-        """Make an API request."""
-        url = f"{self.base_url}/api/{endpoint}"
-        headers = self._get_headers()
+        """Make an API request.
+
+        Returns the decoded response body, or the raw bytes if raw is True.
+        """
+        if self._token_expires_at and not endpoint.startswith("auth/"):
+            self._refresh_if_needed()
+
+        url = _build_url(self.base_url, endpoint)
 
         # Filter out None values from params
-        if params:
+        if params and any(v is None for v in params.values()):
             params = {k: v for k, v in params.items() if v is not None}
 
+        body = None
+        headers = None
+        if data is not None:
+            body = _dumps(data)
+            if self.compress_min_size is not None and len(body) >= self.compress_min_size:
+                body = gzip.compress(body, compresslevel=6)
+                headers = {"Content-Encoding": "gzip"}
+
+        if self._hx is not None:
+            try:
+                response = self._hx.request(
+                    method,
+                    url,
+                    params=params,
+                    content=body,
+                    headers=headers,
+                )
+            except httpx.ConnectError as e:
+                raise ConnectionError(f"Failed to connect to {self.base_url}: {e}")
+            except httpx.TimeoutException:
+                raise TimeoutError(f"Request to {url} timed out")
+            except httpx.HTTPError as e:
+                raise FMSError(f"Request failed: {e}")
+            return self._handle_response(response, raw)
+
         try:
             response = self._session.request(
                 method=method,
                 url=url,
-                headers=headers,
                 params=params,
-                json=data,
+                data=body,
+                headers=headers,
                 timeout=self.timeout,
             )
-            return self._handle_response(response)
+            return self._handle_response(response, raw)
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Failed to connect to {self.base_url}: {e}")
         except requests.exceptions.Timeout:
@@ -217,11 +645,17 @@ class FMSClient:
             "auth/login",
             data={"username": username, "password": password},
         )
-        self._access_token = response["accessToken"]
-        self._refresh_token = response["refreshToken"]
-        self._token_expires_at = datetime.fromisoformat(
-            response["expiresAt"].replace("Z", "+00:00")
+        self.set_tokens(response["accessToken"], response["refreshToken"], _token_expiry(response))
+        return response
+
+    def refresh(self) -> Dict[str, Any]:
+        """Exchange the refresh token for a new access token."""
+        response = self._request(
+            "POST",
+            "auth/refresh",
+            data={"refreshToken": self._refresh_token},
         )
+        self.set_tokens(response["accessToken"], response["refreshToken"], _token_expiry(response))
         return response
 
     def logout(self) -> None:
@@ -235,9 +669,7 @@ class FMSClient:
                 )
             except FMSError:
                 pass
-        self._access_token = None
-        self._refresh_token = None
-        self._token_expires_at = None
+        self.set_tokens(None)
 
     def get_dashboard(self) -> Dict[str, Any]:
         """Get dashboard data."""
@@ -245,12 +677,111 @@ class FMSClient:
 
 
 class LogClient:
-    """Client for log operations."""
+    """Client for log operations.
 
-    def __init__(self, client: FMSClient):
+    Log entries are buffered and sent to the server in batches by the client's
+    background sender, so ``create()`` and the level helpers return without
+    waiting on a network round-trip. Call ``flush()`` to force delivery.
+    After ``FMSClient.close()``, entries are sent synchronously.
+    """
+
+    def __init__(
+        self,
+        client: FMSClient,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_queue: int = 10000,
+    ):
+        """
+        Initialize the log client.
+
+        Args:
+            client: Parent FMS client.
+            batch_size: Maximum number of entries sent per batch request.
+            flush_interval: Maximum seconds an entry waits in the buffer.
+            max_queue: Buffered entries above which the client's overflow
+                policy applies (block the caller or drop the entry).
+        """
         self._client = client
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.failed_count = 0
+        self.dropped_count = 0
+        # Most recent delivery failure, for reporting alongside failed_count
+        self.last_error: Optional[Exception] = None
+
         self._buffer: deque = deque()
-        self._buffer_lock = threading.Lock()
+        self._not_full = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._batch_supported = True
+
+    def __enter__(self) -> "LogClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _drain(self) -> None:
+        """Take the buffered entries and send them."""
+        with self._send_lock:
+            # popleft() is atomic, so producers can keep appending without a
+            # lock while the entries present at this point are taken out
+            buffer = self._buffer
+            popleft = buffer.popleft
+            entries = [popleft() for _ in range(len(buffer))]
+            if not entries:
+                return
+            with self._not_full:
+                self._not_full.notify_all()
+
+            for entry in entries:
+                entry["timestamp"] = _iso_utc(entry["timestamp"])
+            for i in range(0, len(entries), self.batch_size):
+                self._send(entries[i:i + self.batch_size])
+
+    def _send(self, entries: List[Dict[str, Any]]) -> None:
+        """Send a batch, falling back to single POSTs if batching is unsupported.
+
+        A batch rejected with 400 is also resent entry by entry, so one
+        invalid entry doesn't take the rest of the batch down with it.
+        """
+        if self._batch_supported:
+            try:
+                self._client._request("POST", "logs/batch", data={"logs": entries})
+                return
+            except NotFoundError:
+                self._batch_supported = False
+            except ValidationError:
+                pass
+            except Exception as e:
+                self.last_error = e
+                self.failed_count += len(entries)
+                return
+
+        for i, entry in enumerate(entries):
+            try:
+                self._client._request("POST", "logs", data=entry)
+            except ValidationError as e:
+                self.last_error = e
+                self.failed_count += 1
+            except Exception as e:
+                # Server unreachable or failing: don't retry the rest one by one
+                self.last_error = e
+                self.failed_count += len(entries) - i
+                return
+
+    def flush(self) -> None:
+        """Send all buffered log entries immediately."""
+        self._drain()
+
+    def close(self) -> None:
+        """Flush remaining entries.
+
+        The background sender is shared with the rest of the client and keeps
+        running; ``FMSClient.close()`` stops it.
+        """
+        self.flush()
 
     def create(
         self,
@@ -262,60 +793,133 @@ class LogClient:
         correlation_id: Optional[str] = None,
         exception: Optional[str] = None,
         properties: Optional[Dict[str, Any]] = None,
-    ) -> LogEntry:
-        """Create a log entry."""
-        if isinstance(level, str):
-            level = LogLevel(level)
+    ) -> None:
+        """Queue a log entry for delivery."""
+        self._create_with_level(
+            _enum_value(LogLevel, level),
+            message,
+            job_id=job_id,
+            execution_id=execution_id,
+            category=category,
+            correlation_id=correlation_id,
+            exception=exception,
+            properties=properties,
+        )
 
+    def _create_with_level(
+        self,
+        level_value: str,
+        message: str,
+        job_id: Optional[str] = None,
+        execution_id: Optional[str] = None,
+        category: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        exception: Optional[str] = None,
+        properties: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Queue a log entry whose level is already a wire value."""
         data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "level": level.value,
+            "timestamp": time.time_ns(),
+            "level": level_value,
             "message": message,
             "serverName": self._client.server_name,
-            "jobId": job_id,
-            "executionId": execution_id,
-            "category": category,
-            "correlationId": correlation_id,
-            "exception": exception,
-            "properties": properties,
         }
-
-        response = self._client._request("POST", "logs", data=data)
-        return LogEntry.from_dict(response)
-
-    def trace(self, message: str, **kwargs) -> LogEntry:
+        # Only send the optional fields that are set
+        if job_id is not None:
+            data["jobId"] = job_id
+        if execution_id is not None:
+            data["executionId"] = execution_id
+        if category is not None:
+            data["category"] = category
+        if correlation_id is not None:
+            data["correlationId"] = correlation_id
+        if exception is not None:
+            data["exception"] = exception
+        if properties is not None:
+            # Serialize now so unencodable values raise here, in the caller,
+            # rather than on the background sender
+            _dumps(properties)
+            data["properties"] = properties
+
+        sender = self._client._sender
+        sender.start()
+        buffer = self._buffer
+        if len(buffer) >= self.max_queue:
+            if sender.overflow == "drop":
+                self.dropped_count += 1
+                return
+            with self._not_full:
+                while len(buffer) >= self.max_queue and not sender.stopped:
+                    sender.wake()
+                    self._not_full.wait()
+        buffer.append(data)
+        if sender.stopped:
+            # The client was closed and no worker drains the buffer any more
+            self._drain()
+        elif len(buffer) >= self.batch_size:
+            sender.wake()
+
+    def trace(self, message: str, **kwargs) -> None:
         """Create a trace log."""
-        return self.create(message, LogLevel.TRACE, **kwargs)
+        self._create_with_level(_LEVEL_TRACE, message, **kwargs)
 
-    def debug(self, message: str, **kwargs) -> LogEntry:
+    def debug(self, message: str, **kwargs) -> None:
         """Create a debug log."""
-        return self.create(message, LogLevel.DEBUG, **kwargs)
+        self._create_with_level(_LEVEL_DEBUG, message, **kwargs)
 
-    def info(self, message: str, **kwargs) -> LogEntry:
+    def info(self, message: str, **kwargs) -> None:
         """Create an info log."""
-        return self.create(message, LogLevel.INFORMATION, **kwargs)
+        self._create_with_level(_LEVEL_INFORMATION, message, **kwargs)
 
-    def warning(self, message: str, **kwargs) -> LogEntry:
+    def warning(self, message: str, **kwargs) -> None:
         """Create a warning log."""
-        return self.create(message, LogLevel.WARNING, **kwargs)
+        self._create_with_level(_LEVEL_WARNING, message, **kwargs)
 
-    def error(self, message: str, exception: Optional[Exception] = None, **kwargs) -> LogEntry:
+    def error(self, message: str, exception: Optional[Exception] = None, **kwargs) -> None:
         """Create an error log."""
         if exception:
             kwargs["exception"] = str(exception)
-        return self.create(message, LogLevel.ERROR, **kwargs)
+        self._create_with_level(_LEVEL_ERROR, message, **kwargs)
 
-    def critical(self, message: str, exception: Optional[Exception] = None, **kwargs) -> LogEntry:
+    def critical(self, message: str, exception: Optional[Exception] = None, **kwargs) -> None:
         """Create a critical log."""
         if exception:
             kwargs["exception"] = str(exception)
-        return self.create(message, LogLevel.CRITICAL, **kwargs)
+        self._create_with_level(_LEVEL_CRITICAL, message, **kwargs)
 
     def get(self, log_id: str) -> LogEntry:
         """Get a log entry by ID."""
         response = self._client._request("GET", f"logs/{log_id}")
         return LogEntry.from_dict(response)
 
+    def _search_params(
+        self,
+        server_name: Optional[str],
+        job_id: Optional[str],
+        level: Optional[Union[LogLevel, str]],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        page_size: int,
+    ) -> Dict[str, Any]:
+        """Build search query parameters, leaving out unset filters."""
+        params: Dict[str, Any] = {"pageSize": page_size}
+        if server_name is not None:
+            params["serverName"] = server_name
+        if job_id is not None:
+            params["jobId"] = job_id
+        if level is not None:
+            params["level"] = level.value if isinstance(level, LogLevel) else level
+        if start_date:
+            params["startDate"] = start_date.isoformat()
+        if end_date:
+            params["endDate"] = end_date.isoformat()
+        return params
+
+    def _search_page(self, params: Dict[str, Any], page: int) -> PagedResult:
+        """Fetch and decode one page of search results."""
+        raw = self._client._request("GET", "logs/search", params={**params, "page": page}, raw=True)
+        return PagedResult.from_json_bytes(raw, LogEntry)
+
     def search(
         self,
         server_name: Optional[str] = None,
@@ -327,24 +931,50 @@ class LogClient:
         page_size: int = 50,
     ) -> PagedResult:
         """Search logs."""
-        params = {
-            "serverName": server_name,
-            "jobId": job_id,
-            "level": level.value if isinstance(level, LogLevel) else level,
-            "startDate": start_date.isoformat() if start_date else None,
-            "endDate": end_date.isoformat() if end_date else None,
-            "page": page,
-            "pageSize": page_size,
-        }
-        response = self._client._request("GET", "logs/search", params=params)
-        return PagedResult.from_dict(response, LogEntry)
+        params = self._search_params(server_name, job_id, level, start_date, end_date, page_size)
+        return self._search_page(params, page)
+
+    def iter_search(
+        self,
+        server_name: Optional[str] = None,
+        job_id: Optional[str] = None,
+        level: Optional[Union[LogLevel, str]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        page_size: int = 50,
+    ) -> Iterator[LogEntry]:
+        """Iterate over all matching logs, fetching pages as needed.
+
+        The next page is requested in the background while the current one is
+        being consumed.
+        """
+        params = self._search_params(server_name, job_id, level, start_date, end_date, page_size)
+        page = 1
+        result = self._search_page(params, page)
+        while True:
+            future = None
+            if page < result.total_pages:
+                future = self._client._prefetcher().submit(self._search_page, params, page + 1)
+
+            yield from result.items
+
+            if future is None:
+                break
+            result = future.result()
+            page += 1
 
 
 class ServerClient:
     """Client for server operations."""
 
-    def __init__(self, client: FMSClient):
+    def __init__(self, client: FMSClient, min_heartbeat_interval: float = 5.0):
         self._client = client
+        self._min_heartbeat_interval = min_heartbeat_interval
+        self._last_heartbeat_ts = 0.0
+        self._last_heartbeat_key: Optional[tuple] = None
+        self._heartbeat_lock = threading.Lock()
+        self._auto_heartbeat_stop = threading.Event()
+        self._auto_heartbeat_thread: Optional[threading.Thread] = None
 
     def heartbeat(
         self,
@@ -352,17 +982,89 @@ class ServerClient:
         agent_version: str = "1.0.0",
         system_info: Optional[Dict[str, Any]] = None,
     ) -> None:
-        """Send a heartbeat."""
-        if isinstance(status, str):
-            status = ServerStatus(status)
+        """Send a heartbeat.
+
+        Calls repeated within ``min_heartbeat_interval`` seconds with the same
+        server, status and agent version are coalesced into the previous one.
+        Heartbeats that carry ``system_info`` are always sent.
+        """
+        status_value = _enum_value(ServerStatus, status)
+
+        key = (self._client.server_name, status_value, agent_version)
+        with self._heartbeat_lock:
+            if (
+                system_info is None
+                and key == self._last_heartbeat_key
+                and time.monotonic() - self._last_heartbeat_ts < self._min_heartbeat_interval
+            ):
+                return
+
+            data = {
+                "serverName": self._client.server_name,
+                "status": status_value,
+                "agentVersion": agent_version,
+                "systemInfo": system_info,
+            }
+            self._client._request("POST", "servers/heartbeat", data=data)
+            self._last_heartbeat_key = key
+            self._last_heartbeat_ts = time.monotonic()
+
+    def start_auto_heartbeat(
+        self,
+        interval: float = 30.0,
+        status: Union[ServerStatus, str] = ServerStatus.ONLINE,
+        agent_version: str = "1.0.0",
+    ) -> None:
+        """Send heartbeats from a daemon thread every ``interval`` seconds.
+
+        Raises ValueError for an unknown status before the thread starts.
+        """
+        if self._auto_heartbeat_thread is not None:
+            return
+        status_value = _enum_value(ServerStatus, status)
+
+        def run() -> None:
+            while not self._auto_heartbeat_stop.is_set():
+                try:
+                    self.heartbeat(status=status_value, agent_version=agent_version)
+                except FMSError:
+                    pass
+                self._auto_heartbeat_stop.wait(interval)
+
+        self._auto_heartbeat_stop.clear()
+        self._auto_heartbeat_thread = threading.Thread(
+            target=run,
+            name="fmslognexus-heartbeat",
+            daemon=True,
+        )
+        self._auto_heartbeat_thread.start()
+
+    def stop_auto_heartbeat(self) -> None:
+        """Stop the background heartbeat thread."""
+        self._auto_heartbeat_stop.set()
+        if self._auto_heartbeat_thread is not None:
+            self._auto_heartbeat_thread.join()
+            self._auto_heartbeat_thread = None
+
+    def heartbeat_async(
+        self,
+        status: Union[ServerStatus, str] = ServerStatus.ONLINE,
+        agent_version: str = "1.0.0",
+        system_info: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Queue a heartbeat on the background sender without waiting for it.
+
+        Returns False if the heartbeat was dropped because the queue is full.
+        """
+        status_value = _enum_value(ServerStatus, status)
 
         data = {
             "serverName": self._client.server_name,
-            "status": status.value,
+            "status": status_value,
             "agentVersion": agent_version,
             "systemInfo": system_info,
         }
-        self._client._request("POST", "servers/heartbeat", data=data)
+        return self._client._sender.submit("POST", "servers/heartbeat", data)
 
     def get(self, server_name: Optional[str] = None) -> Server:
         """Get server details."""
@@ -373,7 +1075,7 @@ class ServerClient:
     def list(self) -> List[Server]:
         """List all servers."""
         response = self._client._request("GET", "servers")
-        return [Server.from_dict(s) for s in response]
+        return Server.from_dict_many(response)
 
     def set_maintenance(self, server_name: Optional[str] = None, enable: bool = True) -> None:
         """Set server maintenance mode."""
@@ -399,8 +1101,7 @@ class JobClient:
         tags: Optional[List[str]] = None,
     ) -> Job:
         """Register a job."""
-        if isinstance(priority, str):
-            priority = JobPriority(priority)
+        priority_value = _enum_value(JobPriority, priority)
 
         data = {
             "jobId": job_id,
@@ -408,7 +1109,7 @@ class JobClient:
             "description": description,
             "serverName": self._client.server_name,
             "schedule": schedule,
-            "priority": priority.value,
+            "priority": priority_value,
             "timeoutMinutes": timeout_minutes,
             "tags": tags,
         }
@@ -426,7 +1127,7 @@ class JobClient:
             response = self._client._request("GET", f"jobs/server/{server_name}")
         else:
             response = self._client._request("GET", "jobs")
-        return [Job.from_dict(j) for j in response]
+        return Job.from_dict_many(response)
 
     def activate(self, job_id: str) -> None:
         """Activate a job."""
@@ -451,14 +1152,13 @@ class ExecutionClient:
         parameters: Optional[Dict[str, Any]] = None,
     ) -> Execution:
         """Start a job execution."""
-        if isinstance(trigger_type, str):
-            trigger_type = TriggerType(trigger_type)
+        trigger_type_value = _enum_value(TriggerType, trigger_type)
 
         data = {
             "jobId": job_id,
             "serverName": self._client.server_name,
-            "triggerType": trigger_type.value,
-            "triggeredBy": triggered_by or os.getenv("USER", "unknown"),
+            "triggerType": trigger_type_value,
+            "triggeredBy": triggered_by or self._client._default_user,
             "parameters": parameters,
         }
         response = self._client._request("POST", "executions", data=data)
@@ -472,11 +1172,10 @@ class ExecutionClient:
         error_message: Optional[str] = None,
     ) -> Execution:
         """Complete an execution."""
-        if isinstance(status, str):
-            status = ExecutionStatus(status)
+        status_value = _enum_value(ExecutionStatus, status)
 
         data = {
-            "status": status.value,
+            "status": status_value,
             "outputMessage": output_message,
             "errorMessage": error_message,
         }
@@ -495,7 +1194,7 @@ class ExecutionClient:
     def get_running(self) -> List[Execution]:
         """Get running executions."""
         response = self._client._request("GET", "executions/running")
-        return [Execution.from_dict(e) for e in response]
+        return Execution.from_dict_many(response)
 
 
 class AlertClient:
@@ -512,12 +1211,12 @@ class AlertClient:
     def list(self) -> List[Alert]:
         """List all alert rules."""
         response = self._client._request("GET", "alerts")
-        return [Alert.from_dict(a) for a in response]
+        return Alert.from_dict_many(response)
 
     def get_active_instances(self) -> List[AlertInstance]:
         """Get active alert instances."""
         response = self._client._request("GET", "alerts/instances/active")
-        return [AlertInstance.from_dict(a) for a in response]
+        return AlertInstance.from_dict_many(response)
 
     def acknowledge(self, instance_id: str, notes: Optional[str] = None) -> None:
         """Acknowledge an alert instance."""
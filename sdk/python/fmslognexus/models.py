@@ -1,10 +1,91 @@
 """FMS Log Nexus SDK Models."""
 
+import functools
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
-from dateutil.parser import parse as parse_date
+from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar
+
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+# dateutil.parser.parse, imported on first use by _parse_dt
+_parse_date = None
+
+# From 3.11, fromisoformat accepts "Z" and any number of fractional digits
+_ISO_FULL = sys.version_info >= (3, 11)
+
+
+def _normalize_iso(value: str) -> str:
+    """Rewrite an API timestamp into the subset fromisoformat accepts on 3.9/3.10.
+
+    System.Text.Json writes a "Z" suffix, up to 7 fractional digits and no
+    fraction at all for whole seconds, e.g. 2024-01-15T10:30:00.1234567Z;
+    older fromisoformat wants a numeric offset and exactly 3 or 6 digits.
+    """
+    if value[-1:] == "Z":
+        value = value[:-1] + "+00:00"
+    # The fraction, if any, starts right after YYYY-MM-DDTHH:MM:SS
+    if value[19:20] == ".":
+        end = 20
+        while value[end:end + 1].isdigit():
+            end += 1
+        if end != 26:
+            value = f"{value[:20]}{value[20:end][:6]:0<6}{value[end:]}"
+    return value
+
+
+def _parse_dt(value: str) -> datetime:
+    """Parse a timestamp from the API.
+
+    Tries the ciso8601 C parser when it is installed, otherwise the C-level
+    datetime.fromisoformat (after _normalize_iso before Python 3.11), and
+    only falls back to dateutil's format guessing for anything those can't
+    handle.
+    """
+    global _parse_date
+    if ciso8601 is not None:
+        try:
+            return ciso8601.parse_datetime(value)
+        except ValueError:
+            pass
+    elif _ISO_FULL:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    else:
+        try:
+            return datetime.fromisoformat(_normalize_iso(value))
+        except ValueError:
+            pass
+    if _parse_date is None:
+        from dateutil.parser import parse as _parse_date
+    return _parse_date(value)
+
+
+def __getattr__(name: str) -> Any:
+    # parse_date used to be a module-level import of dateutil's parse; keep
+    # it importable without loading dateutil for everyone else
+    if name == "parse_date":
+        from dateutil.parser import parse
+        return parse
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_dt_cached(value: str) -> datetime:
+    """Memoized _parse_dt; bulk results often repeat the same timestamps."""
+    return _parse_dt(value)
 
 
 class LogLevel(str, Enum):
@@ -69,8 +150,36 @@ class AlertSeverity(str, Enum):
     CRITICAL = "Critical"
 
 
-@dataclass
-class LogEntry:
+# Value -> member lookup tables used when decoding API responses, bound to
+# each Enum's own value map. Unknown or missing values map to the field's
+# default instead of raising.
+_LOG_LEVELS = LogLevel._value2member_map_
+_SERVER_STATUSES = ServerStatus._value2member_map_
+_EXECUTION_STATUSES = ExecutionStatus._value2member_map_
+_JOB_PRIORITIES = JobPriority._value2member_map_
+_TRIGGER_TYPES = TriggerType._value2member_map_
+_ALERT_TYPES = AlertType._value2member_map_
+_ALERT_SEVERITIES = AlertSeverity._value2member_map_
+
+# Slotted dataclasses need Python 3.10; older interpreters keep __dict__
+_model = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
+
+_M = TypeVar("_M", bound="_Model")
+
+
+class _Model:
+    """Shared helpers for API models; subclasses define from_dict()."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict_many(cls: Type[_M], items: Iterable[Dict[str, Any]]) -> List[_M]:
+        """Create a list of models from an iterable of dictionaries."""
+        return list(map(cls.from_dict, items))
+
+
+@_model
+class LogEntry(_Model):
     """Log entry model."""
     id: str
     timestamp: datetime
@@ -88,24 +197,25 @@ class LogEntry:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "LogEntry":
         """Create a LogEntry from a dictionary."""
+        get = data.get
         return cls(
-            id=data.get("id", ""),
-            timestamp=parse_date(data["timestamp"]) if data.get("timestamp") else datetime.utcnow(),
-            level=LogLevel(data.get("level", "Information")),
-            message=data.get("message", ""),
-            server_name=data.get("serverName"),
-            job_id=data.get("jobId"),
-            execution_id=data.get("executionId"),
-            category=data.get("category"),
-            correlation_id=data.get("correlationId"),
-            exception=data.get("exception"),
-            properties=data.get("properties"),
-            created_at=parse_date(data["createdAt"]) if data.get("createdAt") else None,
+            id=get("id", ""),
+            timestamp=_parse_dt_cached(v) if (v := get("timestamp")) else datetime.utcnow(),
+            level=_LOG_LEVELS.get(get("level"), LogLevel.INFORMATION),
+            message=get("message", ""),
+            server_name=get("serverName"),
+            job_id=get("jobId"),
+            execution_id=get("executionId"),
+            category=get("category"),
+            correlation_id=get("correlationId"),
+            exception=get("exception"),
+            properties=get("properties"),
+            created_at=_parse_dt_cached(v) if (v := get("createdAt")) else None,
         )
 
 
-@dataclass
-class Server:
+@_model
+class Server(_Model):
     """Server model."""
     server_name: str
     display_name: Optional[str] = None
@@ -119,20 +229,21 @@ class Server:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Server":
         """Create a Server from a dictionary."""
+        get = data.get
         return cls(
-            server_name=data.get("serverName", ""),
-            display_name=data.get("displayName"),
-            status=ServerStatus(data.get("status", "Unknown")),
-            agent_version=data.get("agentVersion"),
-            last_heartbeat=parse_date(data["lastHeartbeat"]) if data.get("lastHeartbeat") else None,
-            is_active=data.get("isActive", True),
-            ip_address=data.get("ipAddress"),
-            os_info=data.get("osInfo"),
+            server_name=get("serverName", ""),
+            display_name=get("displayName"),
+            status=_SERVER_STATUSES.get(get("status"), ServerStatus.UNKNOWN),
+            agent_version=get("agentVersion"),
+            last_heartbeat=_parse_dt_cached(v) if (v := get("lastHeartbeat")) else None,
+            is_active=get("isActive", True),
+            ip_address=get("ipAddress"),
+            os_info=get("osInfo"),
         )
 
 
-@dataclass
-class Job:
+@_model
+class Job(_Model):
     """Job model."""
     job_id: str
     display_name: str
@@ -149,23 +260,24 @@ class Job:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Job":
         """Create a Job from a dictionary."""
+        get = data.get
         return cls(
-            job_id=data.get("jobId", ""),
-            display_name=data.get("displayName", ""),
-            server_name=data.get("serverName", ""),
-            description=data.get("description"),
-            schedule=data.get("schedule"),
-            priority=JobPriority(data.get("priority", "Normal")),
-            is_active=data.get("isActive", True),
-            timeout_minutes=data.get("timeoutMinutes"),
-            last_execution_at=parse_date(data["lastExecutionAt"]) if data.get("lastExecutionAt") else None,
-            last_execution_status=ExecutionStatus(data["lastExecutionStatus"]) if data.get("lastExecutionStatus") else None,
-            tags=data.get("tags", []),
+            job_id=get("jobId", ""),
+            display_name=get("displayName", ""),
+            server_name=get("serverName", ""),
+            description=get("description"),
+            schedule=get("schedule"),
+            priority=_JOB_PRIORITIES.get(get("priority"), JobPriority.NORMAL),
+            is_active=get("isActive", True),
+            timeout_minutes=get("timeoutMinutes"),
+            last_execution_at=_parse_dt_cached(v) if (v := get("lastExecutionAt")) else None,
+            last_execution_status=_EXECUTION_STATUSES.get(get("lastExecutionStatus")),
+            tags=get("tags") or [],
         )
 
 
-@dataclass
-class Execution:
+@_model
+class Execution(_Model):
     """Execution model."""
     id: str
     job_id: str
@@ -183,24 +295,25 @@ class Execution:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Execution":
         """Create an Execution from a dictionary."""
+        get = data.get
         return cls(
-            id=data.get("id", ""),
-            job_id=data.get("jobId", ""),
-            server_name=data.get("serverName", ""),
-            status=ExecutionStatus(data.get("status", "Pending")),
-            started_at=parse_date(data["startedAt"]) if data.get("startedAt") else None,
-            completed_at=parse_date(data["completedAt"]) if data.get("completedAt") else None,
-            duration_ms=data.get("durationMs"),
-            trigger_type=TriggerType(data.get("triggerType", "Manual")),
-            triggered_by=data.get("triggeredBy"),
-            error_message=data.get("errorMessage"),
-            output_message=data.get("outputMessage"),
-            parameters=data.get("parameters"),
+            id=get("id", ""),
+            job_id=get("jobId", ""),
+            server_name=get("serverName", ""),
+            status=_EXECUTION_STATUSES.get(get("status"), ExecutionStatus.PENDING),
+            started_at=_parse_dt_cached(v) if (v := get("startedAt")) else None,
+            completed_at=_parse_dt_cached(v) if (v := get("completedAt")) else None,
+            duration_ms=get("durationMs"),
+            trigger_type=_TRIGGER_TYPES.get(get("triggerType"), TriggerType.MANUAL),
+            triggered_by=get("triggeredBy"),
+            error_message=get("errorMessage"),
+            output_message=get("outputMessage"),
+            parameters=get("parameters"),
         )
 
 
-@dataclass
-class Alert:
+@_model
+class Alert(_Model):
     """Alert rule model."""
     id: str
     name: str
@@ -213,19 +326,20 @@ class Alert:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Alert":
         """Create an Alert from a dictionary."""
+        get = data.get
         return cls(
-            id=data.get("id", ""),
-            name=data.get("name", ""),
-            alert_type=AlertType(data.get("alertType", "Custom")),
-            severity=AlertSeverity(data.get("severity", "Warning")),
-            is_active=data.get("isActive", True),
-            description=data.get("description"),
-            condition=data.get("condition"),
+            id=get("id", ""),
+            name=get("name", ""),
+            alert_type=_ALERT_TYPES.get(get("alertType"), AlertType.CUSTOM),
+            severity=_ALERT_SEVERITIES.get(get("severity"), AlertSeverity.WARNING),
+            is_active=get("isActive", True),
+            description=get("description"),
+            condition=get("condition"),
         )
 
 
-@dataclass
-class AlertInstance:
+@_model
+class AlertInstance(_Model):
     """Alert instance model."""
     id: str
     alert_id: str
@@ -241,21 +355,22 @@ class AlertInstance:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AlertInstance":
         """Create an AlertInstance from a dictionary."""
+        get = data.get
         return cls(
-            id=data.get("id", ""),
-            alert_id=data.get("alertId", ""),
-            alert_name=data.get("alertName", ""),
-            severity=AlertSeverity(data.get("severity", "Warning")),
-            triggered_at=parse_date(data["triggeredAt"]) if data.get("triggeredAt") else datetime.utcnow(),
-            acknowledged_at=parse_date(data["acknowledgedAt"]) if data.get("acknowledgedAt") else None,
-            resolved_at=parse_date(data["resolvedAt"]) if data.get("resolvedAt") else None,
-            acknowledged_by=data.get("acknowledgedBy"),
-            resolved_by=data.get("resolvedBy"),
-            message=data.get("message"),
+            id=get("id", ""),
+            alert_id=get("alertId", ""),
+            alert_name=get("alertName", ""),
+            severity=_ALERT_SEVERITIES.get(get("severity"), AlertSeverity.WARNING),
+            triggered_at=_parse_dt_cached(v) if (v := get("triggeredAt")) else datetime.utcnow(),
+            acknowledged_at=_parse_dt_cached(v) if (v := get("acknowledgedAt")) else None,
+            resolved_at=_parse_dt_cached(v) if (v := get("resolvedAt")) else None,
+            acknowledged_by=get("acknowledgedBy"),
+            resolved_by=get("resolvedBy"),
+            message=get("message"),
         )
 
 
-@dataclass
+@_model
 class PagedResult:
     """Paged result container."""
     items: List[Any]
@@ -267,11 +382,28 @@ class PagedResult:
     @classmethod
     def from_dict(cls, data: Dict[str, Any], item_class: type) -> "PagedResult":
         """Create a PagedResult from a dictionary."""
-        items = [item_class.from_dict(item) for item in data.get("items", [])]
+        get = data.get
+        from_dict = item_class.from_dict
         return cls(
-            items=items,
-            page=data.get("page", 1),
-            page_size=data.get("pageSize", 20),
-            total_count=data.get("totalCount", 0),
-            total_pages=data.get("totalPages", 0),
+            items=list(map(from_dict, get("items") or ())),
+            page=get("page", 1),
+            page_size=get("pageSize", 20),
+            total_count=get("totalCount", 0),
+            total_pages=get("totalPages", 0),
         )
+
+    @classmethod
+    def from_json_bytes(cls, raw: bytes, item_class: type) -> "PagedResult":
+        """Create a PagedResult of item_class models from a raw JSON response body.
+
+        With msgspec installed, the body is decoded in C through the struct
+        mirrors in models_fast, with timestamps still parsed by _parse_dt.
+        Otherwise, or if the payload does not fit the structs, this is
+        from_dict(loads(raw), item_class). Both paths yield item_class
+        instances with the same values.
+        """
+        try:
+            from .models_fast import decode_page
+            return cls(*decode_page(raw, item_class))
+        except (ImportError, KeyError, ValueError):
+            return cls.from_dict(_json_loads(raw), item_class)
@@ -0,0 +1,194 @@
+"""msgspec struct mirrors of the SDK models for bulk decoding.
+
+Only imported by PagedResult.from_json_bytes when msgspec is installed.
+The structs declare the same fields, in the same order, as the dataclasses
+in models.py; camelCase JSON is decoded into them in C and then converted
+to the dataclasses, so callers always get the public models.
+
+Timestamps are decoded as strings and parsed with models._parse_dt, as
+from_dict does. msgspec's own datetime decoding rounds the 7-digit
+fractions .NET writes, where _parse_dt truncates, so the two paths would
+otherwise disagree by a microsecond.
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+import msgspec
+from msgspec.structs import astuple
+
+from .models import (
+    Alert,
+    AlertInstance,
+    AlertSeverity,
+    AlertType,
+    Execution,
+    ExecutionStatus,
+    Job,
+    JobPriority,
+    LogEntry,
+    LogLevel,
+    Server,
+    ServerStatus,
+    TriggerType,
+    _parse_dt_cached,
+)
+
+T = TypeVar("T")
+
+
+class LogEntryStruct(msgspec.Struct, rename="camel"):
+    """Log entry struct."""
+    id: str = ""
+    timestamp: Optional[str] = None
+    level: LogLevel = LogLevel.INFORMATION
+    message: str = ""
+    server_name: Optional[str] = None
+    job_id: Optional[str] = None
+    execution_id: Optional[str] = None
+    category: Optional[str] = None
+    correlation_id: Optional[str] = None
+    exception: Optional[str] = None
+    properties: Optional[Dict[str, Any]] = None
+    created_at: Optional[str] = None
+
+
+class ServerStruct(msgspec.Struct, rename="camel"):
+    """Server struct."""
+    server_name: str = ""
+    display_name: Optional[str] = None
+    status: ServerStatus = ServerStatus.UNKNOWN
+    agent_version: Optional[str] = None
+    last_heartbeat: Optional[str] = None
+    is_active: bool = True
+    ip_address: Optional[str] = None
+    os_info: Optional[str] = None
+
+
+class JobStruct(msgspec.Struct, rename="camel"):
+    """Job struct."""
+    job_id: str = ""
+    display_name: str = ""
+    server_name: str = ""
+    description: Optional[str] = None
+    schedule: Optional[str] = None
+    priority: JobPriority = JobPriority.NORMAL
+    is_active: bool = True
+    timeout_minutes: Optional[int] = None
+    last_execution_at: Optional[str] = None
+    last_execution_status: Optional[ExecutionStatus] = None
+    tags: List[str] = []
+
+
+class ExecutionStruct(msgspec.Struct, rename="camel"):
+    """Execution struct."""
+    id: str = ""
+    job_id: str = ""
+    server_name: str = ""
+    status: ExecutionStatus = ExecutionStatus.PENDING
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+    duration_ms: Optional[int] = None
+    trigger_type: TriggerType = TriggerType.MANUAL
+    triggered_by: Optional[str] = None
+    error_message: Optional[str] = None
+    output_message: Optional[str] = None
+    parameters: Optional[Dict[str, Any]] = None
+
+
+class AlertStruct(msgspec.Struct, rename="camel"):
+    """Alert rule struct."""
+    id: str = ""
+    name: str = ""
+    alert_type: AlertType = AlertType.CUSTOM
+    severity: AlertSeverity = AlertSeverity.WARNING
+    is_active: bool = True
+    description: Optional[str] = None
+    condition: Optional[str] = None
+
+
+class AlertInstanceStruct(msgspec.Struct, rename="camel"):
+    """Alert instance struct."""
+    id: str = ""
+    alert_id: str = ""
+    alert_name: str = ""
+    severity: AlertSeverity = AlertSeverity.WARNING
+    triggered_at: Optional[str] = None
+    acknowledged_at: Optional[str] = None
+    resolved_at: Optional[str] = None
+    acknowledged_by: Optional[str] = None
+    resolved_by: Optional[str] = None
+    message: Optional[str] = None
+
+
+class PagedResultStruct(msgspec.Struct, Generic[T], rename="camel"):
+    """Paged result struct."""
+    items: List[T] = []
+    page: int = 1
+    page_size: int = 20
+    total_count: int = 0
+    total_pages: int = 0
+
+
+# Dataclass model -> struct mirror
+STRUCTS = {
+    LogEntry: LogEntryStruct,
+    Server: ServerStruct,
+    Job: JobStruct,
+    Execution: ExecutionStruct,
+    Alert: AlertStruct,
+    AlertInstance: AlertInstanceStruct,
+}
+
+# Timestamp fields per model -> factory for a missing value (None: stays None)
+_DATETIME_FIELDS: Dict[type, Dict[str, Optional[Callable[[], datetime]]]] = {
+    LogEntry: {"timestamp": datetime.utcnow, "created_at": None},
+    Server: {"last_heartbeat": None},
+    Job: {"last_execution_at": None},
+    Execution: {"started_at": None, "completed_at": None},
+    AlertInstance: {"triggered_at": datetime.utcnow, "acknowledged_at": None, "resolved_at": None},
+}
+
+_decoders: Dict[type, Tuple[msgspec.json.Decoder, Callable[[Any], Any]]] = {}
+
+
+def _converter(item_class: type) -> Callable[[Any], Any]:
+    """Build a struct -> item_class function that parses the timestamp fields."""
+    names = STRUCTS[item_class].__struct_fields__
+    datetime_fields = [
+        (names.index(name), default)
+        for name, default in _DATETIME_FIELDS.get(item_class, {}).items()
+    ]
+    if not datetime_fields:
+        return lambda item: item_class(*astuple(item))
+
+    def convert(item):
+        values = list(astuple(item))
+        for i, default in datetime_fields:
+            value = values[i]
+            if value:
+                values[i] = _parse_dt_cached(value)
+            else:
+                values[i] = default() if default is not None else None
+        return item_class(*values)
+
+    return convert
+
+
+def decode_page(raw: bytes, item_class: type) -> Tuple[List[Any], int, int, int, int]:
+    """Decode a paged JSON response into (items, page, page_size, total_count, total_pages).
+
+    Items are returned as item_class instances. Raises KeyError if
+    item_class has no struct mirror and msgspec.ValidationError if the
+    payload does not match the struct types.
+    """
+    entry = _decoders.get(item_class)
+    if entry is None:
+        entry = _decoders[item_class] = (
+            msgspec.json.Decoder(PagedResultStruct[STRUCTS[item_class]]),
+            _converter(item_class),
+        )
+    decoder, convert = entry
+    result = decoder.decode(raw)
+    items = list(map(convert, result.items))
+    return items, result.page, result.page_size, result.total_count, result.total_pages
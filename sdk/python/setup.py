@@ -12,6 +12,21 @@ with open(os.path.join(here, "README.md"), encoding="utf-8") as f:
 # Read version from package
 version = "1.0.0"
 
+# Optionally compile the model layer with Cython (FMS_LOGNEXUS_CYTHON=1).
+# Cython must already be installed in the build environment (see README);
+# models.py stays valid pure Python, so installs without Cython are unaffected.
+ext_modules = []
+if os.environ.get("FMS_LOGNEXUS_CYTHON") == "1":
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        pass
+    else:
+        ext_modules = cythonize(
+            ["fmslognexus/models.py"],
+            compiler_directives={"language_level": "3"},
+        )
+
 setup(
     name="fms-lognexus",
     version=version,
@@ -27,6 +42,7 @@ setup(
         "Source Code": "https://github.com/your-org/fms-log-nexus",
     },
     packages=find_packages(exclude=["tests", "tests.*"]),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -43,6 +59,8 @@ setup(
     python_requires=">=3.9",
     install_requires=[
         "requests>=2.28.0",
+        # Retry(allowed_methods=...) needs urllib3 1.26
+        "urllib3>=1.26.0",
         "python-dateutil>=2.8.0",
     ],
     extras_require={
@@ -59,6 +77,14 @@ setup(
         "async": [
             "aiohttp>=3.8.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+            "ciso8601>=2.3.0",
+            "msgspec>=0.18.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.24.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -50,6 +50,9 @@ builder.Services.AddScoped<IMaintenanceService, FMSLogNexus.Infrastructure.Servi
 // Add Memory Cache
 builder.Services.AddMemoryCache();
 
+// Accept gzip-compressed request bodies (used by the SDKs for batch log uploads)
+builder.Services.AddRequestDecompression();
+
 // Add Controllers
 builder.Services.AddControllers()
     .AddJsonOptions(options =>
@@ -267,6 +270,9 @@ if (!app.Environment.IsDevelopment())
 // CORS
 app.UseCors(app.Environment.IsDevelopment() ? "AllowAll" : "AllowSpecific");
 
+// Request decompression
+app.UseRequestDecompression();
+
 // Rate limiting
 var rateLimitingOptions = new RateLimitingOptions
 {
@@ -0,0 +1 @@
+"""Command groups for the FMS Log Nexus CLI, loaded on demand by fms_cli.LazyGroup."""
@@ -0,0 +1,94 @@
+"""Alert management commands (``fms-cli alerts``)."""
+
+import click
+
+from fms_cli import _load_sdk, format_datetime, format_json, get_client
+
+
+# Row layouts for `alerts list --active` and `alerts list`
+_INSTANCE_ROW = "{:<36} {:<25} {:<10} {:<20}".format
+_RULE_ROW = "{:<36} {:<30} {:<20} {:<8}".format
+
+
+@click.group(name="alerts")
+def group():
+    """Alert management commands."""
+    pass
+
+
+@group.command("list")
+@click.option("--active", is_flag=True, help="Show only active alert instances")
+@click.pass_context
+def list_alerts(ctx, active):
+    """List alerts."""
+    sdk = _load_sdk()
+    client = get_client(ctx)
+    
+    try:
+        if active:
+            alerts_list = client.alerts.get_active_instances()
+            
+            if ctx.obj["output"] == "json":
+                click.echo(format_json(alerts_list, pretty=True))
+            else:
+                if not alerts_list:
+                    click.echo("No active alerts")
+                    return
+                
+                lines = [_INSTANCE_ROW("ID", "Alert", "Severity", "Triggered"), "-" * 95]
+                lines += [
+                    _INSTANCE_ROW(alert.id, alert.alert_name[:22], alert.severity.value, format_datetime(alert.triggered_at))
+                    for alert in alerts_list
+                ]
+                click.echo("\n".join(lines))
+        else:
+            alerts_list = client.alerts.list()
+            
+            if ctx.obj["output"] == "json":
+                click.echo(format_json(alerts_list, pretty=True))
+            else:
+                if not alerts_list:
+                    click.echo("No alert rules found")
+                    return
+                
+                lines = [_RULE_ROW("ID", "Name", "Type", "Active"), "-" * 95]
+                lines += [
+                    _RULE_ROW(alert.id, alert.name[:27], alert.alert_type.value, "Yes" if alert.is_active else "No")
+                    for alert in alerts_list
+                ]
+                click.echo("\n".join(lines))
+                    
+    except sdk.FMSError as e:
+        raise click.ClickException(str(e))
+
+
+@group.command("acknowledge")
+@click.argument("instance_id")
+@click.option("--notes", "-n", help="Acknowledgement notes")
+@click.pass_context
+def acknowledge_alert(ctx, instance_id, notes):
+    """Acknowledge an alert instance."""
+    sdk = _load_sdk()
+    client = get_client(ctx)
+    
+    try:
+        client.alerts.acknowledge(instance_id, notes=notes)
+        click.echo(f"Alert {instance_id} acknowledged")
+    except sdk.FMSError as e:
+        raise click.ClickException(str(e))
+
+
+@group.command("resolve")
+@click.argument("instance_id")
+@click.option("--notes", "-n", help="Resolution notes")
+@click.pass_context
+def resolve_alert(ctx, instance_id, notes):
+    """Resolve an alert instance."""
+    sdk = _load_sdk()
+    client = get_client(ctx)
+    
+    try:
+        client.alerts.resolve(instance_id, notes=notes)
+        click.echo(f"Alert {instance_id} resolved")
+    except sdk.FMSError as e:
+        raise click.ClickException(str(e))
@@ -0,0 +1,107 @@
+"""Execution management commands (``fms-cli executions``)."""
+
+import click
+
+from fms_cli import _load_sdk, format_datetime, format_json, get_client
+
+
+# Row layout for `executions list`
+_EXECUTION_ROW = "{:<36} {:<15} {:<10} {:<20}".format
+
+
+@click.group(name="executions")
+def group():
+    """Execution management commands."""
+    pass
+
+
+@group.command("list")
+@click.option("--job", "-j", help="Filter by job ID")
+@click.option("--running", is_flag=True, help="Show only running executions")
+@click.pass_context
+def list_executions(ctx, job, running):
+    """List executions."""
+    sdk = _load_sdk()
+    client = get_client(ctx)
+    
+    try:
+        if running:
+            execs = client.executions.get_running()
+        else:
+            # Get recent executions via job if specified
+            execs = []
+            if job:
+                result = client._request("GET", f"executions/job/{job}")
+                execs = sdk.Execution.from_dict_many(result)
+        
+        if ctx.obj["output"] == "json":
+            click.echo(format_json(execs, pretty=True))
+        else:
+            if not execs:
+                click.echo("No executions found")
+                return
+            
+            lines = [_EXECUTION_ROW("ID", "Job", "Status", "Started"), "-" * 85]
+            lines += [
+                _EXECUTION_ROW(ex.id, ex.job_id, ex.status.value, format_datetime(ex.started_at))
+                for ex in execs
+            ]
+            click.echo("\n".join(lines))
+                
+    except sdk.FMSError as e:
+        raise click.ClickException(str(e))
+
+
+@group.command("start")
+@click.argument("job_id")
+@click.option("--server", "-s", help="Server name")
+@click.pass_context
+def start_execution(ctx, job_id, server):
+    """Start a job execution."""
+    sdk = _load_sdk()
+    client = get_client(ctx)
+    
+    if server:
+        client.server_name = server
+    
+    try:
+        execution = client.executions.start(job_id)
+        click.echo(f"Execution started: {execution.id}")
+    except sdk.FMSError as e:
+        raise click.ClickException(str(e))
+
+
+@group.command("complete")
+@click.argument("execution_id")
+@click.option("--status", default="Success", type=click.Choice(["Success", "Failed"]))
+@click.option("--message", "-m", help="Output/error message")
+@click.pass_context
+def complete_execution(ctx, execution_id, status, message):
+    """Complete an execution."""
+    sdk = _load_sdk()
+    client = get_client(ctx)
+    
+    try:
+        if status == "Success":
+            client.executions.complete(execution_id, status=status, output_message=message)
+        else:
+            client.executions.complete(execution_id, status=status, error_message=message)
+        click.echo(f"Execution {execution_id} completed: {status}")
+    except sdk.FMSError as e:
+        raise click.ClickException(str(e))
+
+
+@group.command("cancel")
+@click.argument("execution_id")
+@click.option("--reason", "-r", help="Cancellation reason")
+@click.pass_context
+def cancel_execution(ctx, execution_id, reason):
+    """Cancel an execution."""
+    sdk = _load_sdk()
+    client = get_client(ctx)
+    
+    try:
+        client.executions.cancel(execution_id, reason=reason)
+        click.echo(f"Execution {execution_id} cancelled")
+    except sdk.FMSError as e:
+        raise click.ClickException(str(e))
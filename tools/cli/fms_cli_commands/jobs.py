@@ -0,0 +1,107 @@
+"""Job management commands (``fms-cli jobs``)."""
+
+import click
+
+from fms_cli import _load_sdk, format_json, get_client
+
+
+# Row layout for `jobs list`
+_JOB_ROW = "{:<20} {:<25} {:<15} {:<10} {:<8}".format
+
+
+@click.group(name="jobs")
+def group():
+    """Job management commands."""
+    pass
+
+
+@group.command("list")
+@click.option("--server", "-s", help="Filter by server name")
+@click.option("--active-only", is_flag=True, help="Show only active jobs")
+@click.pass_context
+def list_jobs(ctx, server, active_only):
+    """List jobs."""
+    sdk = _load_sdk()
+    client = get_client(ctx)
+    
+    try:
+        jobs_list = client.jobs.list(server_name=server)
+        
+        if active_only:
+            jobs_list = [j for j in jobs_list if j.is_active]
+        
+        if ctx.obj["output"] == "json":
+            click.echo(format_json(jobs_list, pretty=True))
+        else:
+            if not jobs_list:
+                click.echo("No jobs found")
+                return
+            
+            lines = [_JOB_ROW("Job ID", "Name", "Server", "Priority", "Active"), "-" * 80]
+            lines += [
+                _JOB_ROW(job.job_id, job.display_name[:22], job.server_name, job.priority.value, "Yes" if job.is_active else "No")
+                for job in jobs_list
+            ]
+            click.echo("\n".join(lines))
+                
+    except sdk.FMSError as e:
+        raise click.ClickException(str(e))
+
+
+@group.command("register")
+@click.option("--id", "job_id", required=True, help="Job ID")
+@click.option("--name", required=True, help="Display name")
+@click.option("--description", help="Job description")
+@click.option("--server", "-s", help="Server name")
+@click.option("--priority", default="Normal", type=click.Choice(["Low", "Normal", "High", "Critical"]))
+@click.option("--timeout", type=int, help="Timeout in minutes")
+@click.pass_context
+def register_job(ctx, job_id, name, description, server, priority, timeout):
+    """Register a new job."""
+    sdk = _load_sdk()
+    client = get_client(ctx)
+    
+    if server:
+        client.server_name = server
+    
+    try:
+        job = client.jobs.register(
+            job_id=job_id,
+            display_name=name,
+            description=description,
+            priority=priority,
+            timeout_minutes=timeout,
+        )
+        click.echo(f"Job registered: {job.job_id}")
+    except sdk.FMSError as e:
+        raise click.ClickException(str(e))
+
+
+@group.command("activate")
+@click.argument("job_id")
+@click.pass_context
+def activate_job(ctx, job_id):
+    """Activate a job."""
+    sdk = _load_sdk()
+    client = get_client(ctx)
+    
+    try:
+        client.jobs.activate(job_id)
+        click.echo(f"Job {job_id} activated")
+    except sdk.FMSError as e:
+        raise click.ClickException(str(e))
+
+
+@group.command("deactivate")
+@click.argument("job_id")
+@click.pass_context
+def deactivate_job(ctx, job_id):
+    """Deactivate a job."""
+    sdk = _load_sdk()
+    client = get_client(ctx)
+    
+    try:
+        client.jobs.deactivate(job_id)
+        click.echo(f"Job {job_id} deactivated")
+    except sdk.FMSError as e:
+        raise click.ClickException(str(e))
@@ -0,0 +1,137 @@
+"""Log management commands (``fms-cli logs``)."""
+
+import socket
+from datetime import datetime, timedelta
+from typing import Optional
+
+import click
+
+from fms_cli import _load_sdk, echo_json_items, format_datetime, get_client
+
+
+# Row layout for `logs list`; bound once as a positional formatter
+_LOG_ROW = "{:<20} {:<12} {:<15} {:<50}".format
+
+# --since suffix -> timedelta keyword
+_SINCE_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+def _parse_since(ctx, param, value: Optional[str]) -> Optional[timedelta]:
+    """Click callback turning '30m', '24h', '7d' etc. into a timedelta."""
+    if not value:
+        return None
+    unit = _SINCE_UNITS.get(value[-1])
+    if unit is None or not value[:-1].isdigit():
+        raise click.BadParameter(f"expected a number followed by one of {', '.join(_SINCE_UNITS)} (e.g. '24h')")
+    return timedelta(**{unit: int(value[:-1])})
+
+
+@click.group(name="logs")
+def group():
+    """Log management commands."""
+    pass
+
+
+@group.command("list")
+@click.option("--server", "-s", help="Filter by server name")
+@click.option("--job", "-j", help="Filter by job ID")
+@click.option("--level", "-l", type=click.Choice(["Trace", "Debug", "Information", "Warning", "Error", "Critical"]))
+@click.option("--since", callback=_parse_since, help="Show logs since (e.g., '30m', '24h', '7d')")
+@click.option("--limit", default=20, help="Number of logs to show")
+@click.pass_context
+def list_logs(ctx, server, job, level, since, limit):
+    """List recent logs."""
+    sdk = _load_sdk()
+    client = get_client(ctx)
+    
+    start_date = datetime.utcnow() - since if since else None
+    
+    try:
+        result = client.logs.search(
+            server_name=server,
+            job_id=job,
+            level=level,
+            start_date=start_date,
+            page_size=limit,
+        )
+        
+        if ctx.obj["output"] == "json":
+            echo_json_items(result.items)
+        else:
+            if not result.items:
+                click.echo("No logs found")
+                return
+            
+            lines = [_LOG_ROW("Timestamp", "Level", "Server", "Message"), "-" * 100]
+            for log in result.items:
+                msg = log.message if len(log.message) <= 50 else log.message[:47] + "..."
+                lines.append(_LOG_ROW(format_datetime(log.timestamp), log.level.value, log.server_name or "-", msg))
+            lines.append(f"\nShowing {len(result.items)} of {result.total_count} logs")
+            click.echo("\n".join(lines))
+            
+    except sdk.FMSError as e:
+        raise click.ClickException(str(e))
+
+
+@group.command("send")
+@click.option("--message", "-m", required=True, help="Log message")
+@click.option("--level", "-l", default="Information", type=click.Choice(["Trace", "Debug", "Information", "Warning", "Error", "Critical"]))
+@click.option("--server", "-s", help="Server name")
+@click.option("--job", "-j", help="Job ID")
+@click.pass_context
+def send_log(ctx, message, level, server, job):
+    """Send a log entry."""
+    # Hand off to a running `fms-cli daemon` unless connection options were
+    # given; the daemon needs unix sockets, which Windows Python lacks
+    if not (ctx.obj.get("url") or ctx.obj.get("api_key")) and hasattr(socket, "AF_UNIX"):
+        import fms_cli_daemon
+        
+        response = fms_cli_daemon.forward("logs.send", {
+            "message": message,
+            "level": level,
+            "server": server,
+            "job": job,
+        })
+        if response is not None:
+            if not response["ok"]:
+                raise click.ClickException(response["error"])
+            click.echo(response["output"])
+            return
+    
+    client = get_client(ctx)
+    
+    if server:
+        client.server_name = server
+    
+    client.logs.create(
+        message=message,
+        level=level,
+        job_id=job,
+    )
+    client.close()
+    
+    if client.logs.failed_count:
+        raise click.ClickException(str(client.logs.last_error or "Failed to send log entry"))
+    click.echo("Log sent")
+
+
+@group.command("stats")
+@click.option("--since", default="24h", callback=_parse_since, help="Time period (e.g., '1h', '24h', '7d')")
+@click.pass_context
+def log_stats(ctx, since):
+    """Show log statistics."""
+    sdk = _load_sdk()
+    client = get_client(ctx)
+    
+    try:
+        dashboard = client.get_dashboard()
+        logs_data = dashboard.get("logs", {})
+        
+        click.echo("Log Statistics")
+        click.echo("-" * 40)
+        click.echo(f"Total (24h):     {logs_data.get('total24h', 0):,}")
+        click.echo(f"Errors (24h):    {logs_data.get('errors24h', 0):,}")
+        click.echo(f"Warnings (24h):  {logs_data.get('warnings24h', 0):,}")
+        
+    except sdk.FMSError as e:
+        raise click.ClickException(str(e))
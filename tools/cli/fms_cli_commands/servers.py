@@ -0,0 +1,66 @@
+"""Server management commands (``fms-cli servers``)."""
+
+import click
+
+from fms_cli import _load_sdk, format_datetime, format_json, get_client
+
+
+# Row layout for `servers list`
+_SERVER_ROW = "{:<25} {:<12} {:<20} {:<15}".format
+
+
+@click.group(name="servers")
+def group():
+    """Server management commands."""
+    pass
+
+
+@group.command("list")
+@click.option("--online-only", is_flag=True, help="Show only online servers")
+@click.pass_context
+def list_servers(ctx, online_only):
+    """List all servers."""
+    sdk = _load_sdk()
+    client = get_client(ctx)
+    
+    try:
+        servers_list = client.servers.list()
+        
+        if online_only:
+            servers_list = [s for s in servers_list if s.status.value == "Online"]
+        
+        if ctx.obj["output"] == "json":
+            click.echo(format_json(servers_list, pretty=True))
+        else:
+            if not servers_list:
+                click.echo("No servers found")
+                return
+            
+            lines = [_SERVER_ROW("Server Name", "Status", "Last Heartbeat", "Agent Version"), "-" * 75]
+            lines += [
+                _SERVER_ROW(server.server_name, server.status.value, format_datetime(server.last_heartbeat), server.agent_version or "-")
+                for server in servers_list
+            ]
+            click.echo("\n".join(lines))
+                
+    except sdk.FMSError as e:
+        raise click.ClickException(str(e))
+
+
+@group.command("heartbeat")
+@click.option("--server", "-s", help="Server name (default: hostname)")
+@click.option("--status", default="Online", type=click.Choice(["Online", "Offline", "Maintenance"]))
+@click.pass_context
+def send_heartbeat(ctx, server, status):
+    """Send a heartbeat."""
+    sdk = _load_sdk()
+    client = get_client(ctx)
+    
+    if server:
+        client.server_name = server
+    
+    try:
+        client.servers.heartbeat(status=status)
+        click.echo(f"Heartbeat sent for {client.server_name}: {status}")
+    except sdk.FMSError as e:
+        raise click.ClickException(str(e))
@@ -0,0 +1,169 @@
+"""
+Long-lived helper process for the FMS Log Nexus CLI.
+
+``fms-cli daemon`` keeps one FMSClient, and with it one pooled HTTP
+connection, alive and serves other ``fms-cli`` invocations over a unix socket.
+Scripts that call ``fms-cli logs send`` in a loop then skip the SDK import and a
+fresh TLS handshake on every call.
+
+Protocol: one newline-terminated JSON request per connection,
+``{"cmd": "logs.send", "args": {...}}``, answered with
+``{"ok": true, "output": "..."}`` or ``{"ok": false, "error": "..."}``.
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+
+def socket_path() -> Path:
+    """Socket location: $FMS_CLI_SOCKET, else $XDG_RUNTIME_DIR/fms-cli.sock.
+
+    Without either, the socket lives in the CLI's config directory.
+    """
+    path = os.environ.get("FMS_CLI_SOCKET")
+    if path:
+        return Path(path)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "fms-cli.sock"
+    from fms_cli import _config_dir
+    return _config_dir() / "fms-cli.sock"
+
+
+def forward(cmd: str, args: Dict[str, Any], timeout: float = 30.0) -> Optional[dict]:
+    """Send a request to a running daemon; returns None if none is listening.
+
+    Once the request has been handed over, failures come back as an error
+    response rather than None: the daemon may already have acted on it, so
+    the caller must not retry it directly.
+    """
+    path = socket_path()
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps({"cmd": cmd, "args": args}).encode() + b"\n")
+            with sock.makefile("rb") as f:
+                return json.loads(f.readline())
+    except (ConnectionRefusedError, FileNotFoundError):
+        # Stale socket left behind by a daemon that is no longer running
+        return None
+    except socket.timeout:
+        return {"ok": False, "error": f"No reply from the daemon on {path} within {timeout:g}s"}
+    except (ConnectionResetError, ValueError):
+        # Empty or truncated reply: the daemon exited mid-request
+        return {"ok": False, "error": f"The daemon on {path} closed the connection without replying"}
+
+
+def _send_log(client, args: Dict[str, Any]) -> str:
+    """Handle logs.send: queue the entry and flush it on the shared client."""
+    failed = client.logs.failed_count
+    server_name = client.server_name
+    if args.get("server"):
+        client.server_name = args["server"]
+    try:
+        client.logs.create(
+            message=args["message"],
+            level=args.get("level", "Information"),
+            job_id=args.get("job"),
+        )
+        client.logs.flush()
+    finally:
+        client.server_name = server_name
+    if client.logs.failed_count != failed:
+        raise RuntimeError(str(client.logs.last_error or "Failed to send log entry"))
+    return "Log sent"
+
+
+COMMANDS: Dict[str, Callable[[Any, Dict[str, Any]], str]] = {
+    "logs.send": _send_log,
+}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Reads one request line and writes one response line."""
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+            handler = COMMANDS[request["cmd"]]
+            response = {"ok": True, "output": handler(self.server.client, request.get("args") or {})}
+        except KeyError as e:
+            response = {"ok": False, "error": f"Unsupported request: missing {e}"}
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server sharing one lazily created FMSClient.
+
+    Requests are handled one at a time, so handlers may temporarily adjust
+    client state such as server_name.
+    """
+
+    def __init__(self, path: Path, client_factory: Callable[[], Any]):
+        self._client_factory = client_factory
+        self._client = None
+        # Owner-only socket: the daemon acts with the user's credentials
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(path), _Handler)
+        finally:
+            os.umask(old_umask)
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = self._client_factory()
+        return self._client
+
+    def server_close(self):
+        super().server_close()
+        if self._client is not None:
+            self._client.close()
+
+
+def _is_listening(path: Path) -> bool:
+    """Return True if a daemon is accepting connections on path."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+def serve(
+    path: Path,
+    client_factory: Callable[[], Any],
+    on_ready: Optional[Callable[[], None]] = None,
+) -> None:
+    """Serve requests on path until interrupted; on_ready runs once bound."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists() and _is_listening(path):
+        raise RuntimeError(f"A daemon is already listening on {path}")
+    path.unlink(missing_ok=True)
+    server = DaemonServer(path, client_factory)
+    # Exit through the finally block below on `kill` as well as Ctrl-C
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        if on_ready is not None:
+            on_ready()
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
@@ -1,23 +1,34 @@
 #!/usr/bin/env python3
 """Setup script for FMS Log Nexus CLI."""
 
+from pathlib import Path
+
 from setuptools import setup, find_packages
 
+# Read README for long description, if present
+readme = Path(__file__).parent / "README.md"
+long_description = readme.read_text(encoding="utf-8") if readme.exists() else ""
+
 setup(
     name="fms-lognexus-cli",
     version="1.0.0",
     author="FMS Log Nexus Team",
     author_email="team@example.com",
     description="Command-line administration tool for FMS Log Nexus",
-    long_description=open("README.md").read(),
+    long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/your-org/fms-log-nexus",
-    py_modules=["fms_cli"],
+    py_modules=["fms_cli", "fms_cli_daemon"],
+    packages=["fms_cli_commands"],
     install_requires=[
         "click>=8.0.0",
-        "requests>=2.28.0",
         "fms-lognexus>=1.0.0",
     ],
+    extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "fms-cli=fms_cli:main",